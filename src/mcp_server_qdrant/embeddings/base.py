@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def embed_documents(self, documents: list[str]) -> list[list[float]]:
         """Embed a list of documents into vectors."""
@@ -21,5 +23,14 @@ class EmbeddingProvider(ABC):
 
     @abstractmethod
     def get_vector_size(self) -> int:
-        """Get the size of the vector for the Qdrant collection."""
+        """
+        Get the size of the vector for the Qdrant collection.
+        Providers learning the size from the embeddings they get back may raise a
+        RuntimeError until their first response, so callers needing the size, e.g. to
+        create a collection, must embed something before calling this method.
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release any resources held by the provider, e.g. network connections."""
         pass
@@ -1,49 +1,147 @@
 from __future__ import annotations
 
-from typing import List
+import asyncio
+from collections import OrderedDict
 
-from openai import AsyncOpenAI, OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from mcp_server_qdrant.embeddings.base import EmbeddingProvider
 
+# Upper bound on the number of inputs sent in a single embeddings request.
+_BATCH_SIZE = 256
+# Maximum number of embeddings requests in flight for a single call.
+_MAX_CONCURRENCY = 5
+# Maximum number of query embeddings kept in the exact-match cache.
+_QUERY_CACHE_SIZE = 1024
+
+# Output dimensionality of the OpenAI embedding models, as documented by OpenAI.
+_KNOWN_DIMS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
+
+def _create_client() -> AsyncOpenAI:
+    # A single HTTP/2 connection pool shared by all the concurrent requests. The SDK's
+    # own httpx client keeps its defaults, e.g. proxies from the environment and
+    # following redirects, and retries are left to the SDK's max_retries.
+    http_client = DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
+    return AsyncOpenAI(http_client=http_client)
+
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     """
     OpenAI implementation of the embedding provider.
-    Uses the AsyncOpenAI client for runtime requests while probing the vector size
-    synchronously during initialization to avoid async calls inside __init__.
+    Uses the AsyncOpenAI client for all requests. The vector size of the well-known
+    models is looked up from a static table; for any other model it is learned from
+    the first embeddings response, so no network call is made during initialization.
     """
 
+    __slots__ = (
+        "model_name",
+        "_async_client",
+        "_vector_size",
+        "_vector_name",
+        "_query_cache",
+        "_query_cache_max",
+        "_query_cache_lock",
+    )
+
     def __init__(self, model_name: str):
         self.model_name = model_name
-        self._async_client = AsyncOpenAI()
-        # Prime the vector size once so collection creation knows the dimension.
-        sync_client = OpenAI()
-        probe = sync_client.embeddings.create(
-            model=self.model_name, input="vector-dimension-probe"
-        )
-        self._vector_size = len(probe.data[0].embedding)
+        self._async_client = _create_client()
+        self._vector_size: int | None = _KNOWN_DIMS.get(model_name)
+        # Exact-match LRU cache of query embeddings, keyed on the normalized query.
+        self._query_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._query_cache_max = _QUERY_CACHE_SIZE
+        self._query_cache_lock = asyncio.Lock()
         safe_model_name = (
             self.model_name.replace("/", "-").replace(":", "-").replace(" ", "-")
         )
         self._vector_name = f"openai-{safe_model_name}".lower()
 
     async def embed_documents(self, documents: list[str]) -> list[list[float]]:
-        response = await self._async_client.embeddings.create(
-            model=self.model_name, input=documents
+        # Split the documents into bounded batches and send them concurrently,
+        # so large inputs overlap their network round-trips.
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                response = await self._client().embeddings.create(
+                    model=self.model_name, input=batch
+                )
+            data = response.data
+            if len(data) != len(batch):
+                raise RuntimeError(
+                    f"Expected {len(batch)} embeddings from the model "
+                    f"{self.model_name}, got {len(data)}"
+                )
+            # The API returns the items in request order, so only sort if it did not
+            if any(getattr(item, "index", i) != i for i, item in enumerate(data)):
+                data = sorted(data, key=lambda item: item.index)
+            if data:
+                self._remember_vector_size(data[0].embedding)
+            # The SDK already returns every embedding as a list, no need to copy it
+            return [item.embedding for item in data]
+
+        # gather keeps the order of the batches, so the results line up with the input
+        batches = await asyncio.gather(
+            *(
+                embed_batch(documents[offset : offset + _BATCH_SIZE])
+                for offset in range(0, len(documents), _BATCH_SIZE)
+            )
         )
-        # Ensure results are returned in the same order as the inputs
-        sorted_data = sorted(response.data, key=lambda item: getattr(item, "index", 0))
-        return [list(item.embedding) for item in sorted_data]
+        return [embedding for batch in batches for embedding in batch]
 
     async def embed_query(self, query: str) -> list[float]:
-        response = await self._async_client.embeddings.create(
+        # Queries differing only in case or surrounding whitespace share an entry.
+        key = query.strip().lower()
+        async with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                return list(cached)
+
+        response = await self._client().embeddings.create(
             model=self.model_name, input=query
         )
-        return list(response.data[0].embedding)
+        embedding = list(response.data[0].embedding)
+        self._remember_vector_size(embedding)
+
+        async with self._query_cache_lock:
+            self._query_cache[key] = embedding
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > self._query_cache_max:
+                self._query_cache.popitem(last=False)
+        return list(embedding)
+
+    def _remember_vector_size(self, embedding: list[float]) -> None:
+        if self._vector_size is None:
+            self._vector_size = len(embedding)
+
+    def _client(self) -> AsyncOpenAI:
+        # The provider may outlive an application closing it on shutdown, so a closed
+        # client is replaced by a new one on the next request.
+        if self._async_client.is_closed():
+            self._async_client = _create_client()
+        return self._async_client
+
+    async def close(self) -> None:
+        await self._async_client.close()
 
     def get_vector_name(self) -> str:
         return self._vector_name
 
     def get_vector_size(self) -> int:
+        if self._vector_size is None:
+            raise RuntimeError(
+                f"Vector size of the model {self.model_name} is not known until "
+                "the first embeddings request completes"
+            )
         return self._vector_size
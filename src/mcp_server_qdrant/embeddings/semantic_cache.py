@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Generic, Hashable, TypeVar
+
+import numpy as np
+
+V = TypeVar("V")
+
+# Default number of embeddings kept before the oldest ones get overwritten.
+DEFAULT_CAPACITY = 4096
+# Default minimal cosine similarity for two queries to be considered the same.
+DEFAULT_THRESHOLD = 0.97
+# Default number of seconds an entry is served for after being stored.
+DEFAULT_TTL = 60.0
+# Initial number of allocated rows, doubled until the capacity is reached.
+_INITIAL_ROWS = 64
+
+
+class SemanticCache(Generic[V]):
+    """
+    Bounded cache keyed on query embeddings instead of the query text.
+    A lookup hits when the cosine similarity between the query embedding and one of
+    the stored embeddings is at least `threshold`, so paraphrased queries can share
+    an entry. Stored embeddings are L2-normalized, so the similarity against all of
+    them is a single matrix-vector product. Once `capacity` entries are stored, the
+    oldest ones are overwritten in a ring-buffer fashion. Entries older than `ttl`
+    seconds are never returned.
+    :param capacity: The maximum number of entries kept in the cache.
+    :param threshold: The minimal cosine similarity required for a hit.
+    :param ttl: The number of seconds an entry stays valid, None to keep it forever.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl: float | None = DEFAULT_TTL,
+    ):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        self._keys: np.ndarray | None = None
+        self._tags: list[Hashable] = []
+        self._tag_hashes = np.zeros(0, dtype=np.int64)
+        self._stored_at = np.zeros(0, dtype=np.float64)
+        self._values: list[V] = []
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, embedding: list[float], tag: Hashable = None) -> V | None:
+        """
+        Find the value stored for the most similar embedding, if it is similar enough.
+        :param embedding: The embedding of the query.
+        :param tag: Only entries stored with an equal tag are considered, e.g. the
+                    collection name and the filter the result was computed for.
+        :return: The cached value, or None if there is no match.
+        """
+        query = self._normalize(embedding)
+        if self._keys is None or query is None or query.shape[0] != self._keys.shape[1]:
+            return None
+
+        size = len(self._values)
+        scores = self._keys[:size] @ query
+        scores[self._tag_hashes[:size] != hash(tag)] = -np.inf
+        if self.ttl is not None:
+            scores[self._stored_at[:size] < time.monotonic() - self.ttl] = -np.inf
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold or self._tags[best] != tag:
+            return None
+        return self._values[best]
+
+    def put(self, embedding: list[float], value: V, tag: Hashable = None) -> None:
+        """
+        Store a value for the given embedding, overwriting the oldest entry if full.
+        :param embedding: The embedding of the query.
+        :param value: The value to store.
+        :param tag: The tag the value is only valid for.
+        """
+        key = self._normalize(embedding)
+        if key is None:
+            return
+        if self._keys is None or key.shape[0] != self._keys.shape[1]:
+            # The first entry, or the embedding model changed: start over.
+            self.clear()
+            rows = min(_INITIAL_ROWS, self.capacity)
+            self._keys = np.zeros((rows, key.shape[0]), dtype=np.float32)
+            self._tag_hashes = np.zeros(rows, dtype=np.int64)
+            self._stored_at = np.zeros(rows, dtype=np.float64)
+
+        size = len(self._values)
+        if size < self.capacity:
+            if size == self._keys.shape[0]:
+                self._grow()
+            index = size
+            self._tags.append(tag)
+            self._values.append(value)
+        else:
+            index = self._next
+            self._tags[index] = tag
+            self._values[index] = value
+        self._keys[index] = key
+        self._tag_hashes[index] = hash(tag)
+        self._stored_at[index] = time.monotonic()
+        self._next = (index + 1) % self.capacity
+
+    def clear(self) -> None:
+        """Remove all the entries from the cache."""
+        self._keys = None
+        self._tags = []
+        self._tag_hashes = np.zeros(0, dtype=np.int64)
+        self._stored_at = np.zeros(0, dtype=np.float64)
+        self._values = []
+        self._next = 0
+
+    def _grow(self) -> None:
+        assert self._keys is not None
+        rows = min(self._keys.shape[0] * 2, self.capacity)
+        keys = np.zeros((rows, self._keys.shape[1]), dtype=np.float32)
+        keys[: self._keys.shape[0]] = self._keys
+        self._keys = keys
+        tag_hashes = np.zeros(rows, dtype=np.int64)
+        tag_hashes[: self._tag_hashes.shape[0]] = self._tag_hashes
+        self._tag_hashes = tag_hashes
+        stored_at = np.zeros(rows, dtype=np.float64)
+        stored_at[: self._stored_at.shape[0]] = self._stored_at
+        self._stored_at = stored_at
+
+    @staticmethod
+    def _normalize(embedding: Any) -> np.ndarray | None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        return vector / norm
@@ -9,66 +9,176 @@ without implementing the streaming contract.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List
+import asyncio
+import contextlib
+import functools
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List
 
+import orjson
 from fastmcp.server.http import create_streamable_http_app
 from qdrant_client import models
 from starlette.applications import Starlette
-from starlette.datastructures import Headers
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 from starlette.routing import Mount, Route
 
+from .embeddings.semantic_cache import SemanticCache
 from .server import mcp
 from .qdrant import Entry
 
+# Results of recent qdrant-find calls, so paraphrased repeats skip the Qdrant search.
+# Writes through the connector invalidate them, the TTL bounds how long results can
+# miss the writes done by other clients of the Qdrant server.
+_find_cache: SemanticCache[List[Entry]] = SemanticCache()
+# Serialized tool definitions returned by tools/list.
+_tool_payload_cache: List[Dict[str, Any]] | None = None
+# Maximum number of calls accepted in a single JSON-RPC batch.
+_MAX_BATCH_SIZE = 32
+# Namespaces clients may prefix the tool names with, e.g. `qdrant.qdrant-find`.
+_TOOL_NAMESPACES = frozenset({"qdrant", "qdrant-rag", "qdrant-rag-mcp"})
 
-def _jsonrpc_result(id_value: Any, result: Dict[str, Any]) -> JSONResponse:
-    return JSONResponse({"jsonrpc": "2.0", "id": id_value, "result": result})
 
+class ORJSONResponse(Response):
+    """JSON response serialized with orjson instead of the standard library."""
 
-def _jsonrpc_error(id_value: Any, code: int, message: str) -> JSONResponse:
-    return JSONResponse(
-        {"jsonrpc": "2.0", "id": id_value, "error": {"code": code, "message": message}}
-    )
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Constant reply to undecodable payloads, rendered once. HybridMCPApp only reads
+# its status, headers and body, so sharing one instance is safe.
+_PARSE_ERROR_RESPONSE = Response(
+    orjson.dumps({"error": "Invalid JSON-RPC payload"}),
+    status_code=400,
+    media_type="application/json",
+)
+
+
+def _jsonrpc_result(id_value: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": id_value, "result": result}
+
+
+def _jsonrpc_error(id_value: Any, code: int, message: str) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": id_value,
+        "error": {"code": code, "message": message},
+    }
 
 
 async def _tool_payload() -> List[Dict[str, Any]]:
-    tools = await mcp._tool_manager.get_tools()
-    return [tool.to_mcp_tool().model_dump() for tool in tools.values()]
+    # Tools are registered at startup, so the payload is only built once and
+    # rebuilt after a tools/list_changed notification.
+    global _tool_payload_cache
+    if _tool_payload_cache is None:
+        tools = await mcp._tool_manager.get_tools()
+        _tool_payload_cache = [
+            tool.to_mcp_tool().model_dump() for tool in tools.values()
+        ]
+    return _tool_payload_cache
 
 
 def _resolve_tool_name(raw_name: str | None) -> str:
     if not raw_name:
         raise ValueError("Missing tool name")
-    name = raw_name
-    if "." in raw_name:
-        namespace, rest = raw_name.split(".", 1)
-        if namespace in {"qdrant", "qdrant-rag", "qdrant-rag-mcp"}:
-            name = rest
-    elif raw_name.startswith("qdrant_"):
-        name = raw_name[len("qdrant_") :]
-    return name
+    namespace, separator, rest = raw_name.partition(".")
+    if separator:
+        return rest if namespace in _TOOL_NAMESPACES else raw_name
+    return raw_name.removeprefix("qdrant_")
+
+
+def _text_block(item: Any) -> Dict[str, Any]:
+    return {"type": "text", "text": str(item)}
+
+
+def _model_block(item: Any) -> Dict[str, Any]:
+    return item.model_dump()  # pydantic BaseModel
+
+
+def _dict_block(item: Any) -> Dict[str, Any]:
+    return item
+
+
+# Serializer of each content item type, resolved once per type by _pick_serializer.
+_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {str: _text_block}
+
+
+def _pick_serializer(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    if hasattr(cls, "model_dump"):
+        serializer = _model_block
+    elif issubclass(cls, dict):
+        serializer = _dict_block
+    else:
+        serializer = _text_block
+    _SERIALIZERS[cls] = serializer
+    return serializer
 
 
 def _serialize_content(items: Iterable[Any]) -> List[Dict[str, Any]]:
     content: List[Dict[str, Any]] = []
     for item in items:
-        if hasattr(item, "model_dump"):
-            content.append(item.model_dump())  # pydantic BaseModel
-        elif isinstance(item, dict):
-            content.append(item)
-        else:
-            content.append({"type": "text", "text": str(item)})
+        cls = type(item)
+        serializer = _SERIALIZERS.get(cls) or _pick_serializer(cls)
+        content.append(serializer(item))
     return content
 
 
-async def _handle_jsonrpc(request: Request) -> JSONResponse:
+async def _read_body(receive) -> bytes:
+    body = bytearray()
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        body.extend(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return bytes(body)
+
+
+async def _handle_jsonrpc(body: bytes) -> Response:
     try:
-        payload = await request.json()
+        payload = orjson.loads(body)
     except Exception:  # noqa: BLE001
-        return JSONResponse({"error": "Invalid JSON-RPC payload"}, status_code=400)
+        return _PARSE_ERROR_RESPONSE
+
+    if not isinstance(payload, list):
+        return ORJSONResponse(await _dispatch_one(payload))
+
+    # JSON-RPC batch: run all the calls concurrently and only answer the
+    # requests, not the notifications (items without an id).
+    if not payload:
+        return ORJSONResponse(_jsonrpc_error(None, -32600, "Empty batch"))
+    if len(payload) > _MAX_BATCH_SIZE:
+        # Every item may embed a query and search Qdrant, so keep batches bounded.
+        return ORJSONResponse(
+            _jsonrpc_error(
+                None, -32600, f"Batch too large, at most {_MAX_BATCH_SIZE} items"
+            )
+        )
+    results = await asyncio.gather(*(_dispatch_one(item) for item in payload))
+    replies = [
+        result
+        for item, result in zip(payload, results)
+        if not isinstance(item, dict) or "id" in item
+    ]
+    if not replies:
+        return Response(status_code=204)
+    return ORJSONResponse(replies)
+
+
+async def _dispatch_one(payload: Any) -> Dict[str, Any]:
+    if not isinstance(payload, dict):
+        return _jsonrpc_error(None, -32600, "Invalid JSON-RPC request")
+    try:
+        return await _dispatch_method(payload)
+    except Exception as exc:  # noqa: BLE001
+        # Never let a single call fail the whole HTTP request, e.g. in a batch.
+        return _jsonrpc_error(payload.get("id"), -32603, f"Internal error: {exc}")
+
 
+async def _dispatch_method(payload: Dict[str, Any]) -> Dict[str, Any]:
     method = payload.get("method")
     id_value = payload.get("id")
 
@@ -84,13 +194,22 @@ async def _handle_jsonrpc(request: Request) -> JSONResponse:
         return _jsonrpc_result(id_value, {"tools": await _tool_payload()})
 
     if method == "tools/list_changed":
+        global _tool_payload_cache
+        _tool_payload_cache = None
         return _jsonrpc_result(id_value, {})
 
     if method == "tools/call":
         params = payload.get("params") or {}
-        name = _resolve_tool_name(params.get("name"))
+        if not isinstance(params, dict):
+            return _jsonrpc_error(id_value, -32602, "params must be an object")
         arguments = params.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            return _jsonrpc_error(id_value, -32602, "arguments must be an object")
+        raw_name = params.get("name")
+        if raw_name is not None and not isinstance(raw_name, str):
+            return _jsonrpc_error(id_value, -32602, "name must be a string")
         try:
+            name = _resolve_tool_name(raw_name)
             result_blocks = await _call_tool_direct(name, arguments)
         except Exception as exc:  # noqa: BLE001
             return _jsonrpc_error(id_value, -32000, str(exc))
@@ -105,17 +224,27 @@ async def _handle_jsonrpc(request: Request) -> JSONResponse:
     return _jsonrpc_error(id_value, -32601, f"Method not implemented: {method}")
 
 
-def _should_use_jsonrpc(scope, headers: Headers) -> bool:
+def _header(scope, name: bytes) -> str:
+    # ASGI servers provide the header names lower-cased already.
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def _should_use_jsonrpc(scope) -> bool:
     if scope["method"] != "POST":
         return False
-    accept = headers.get("accept", "")
+    accept = _header(scope, b"accept")
     if "application/json-seq" in accept or "text/event-stream" in accept:
         return False
-    content_type = headers.get("content-type", "")
+    content_type = _header(scope, b"content-type")
     return "application/json" in content_type.lower()
 
 
 class HybridMCPApp:
+    __slots__ = ("stream_app",)
+
     def __init__(self, stream_app):
         self.stream_app = stream_app
 
@@ -124,13 +253,21 @@ class HybridMCPApp:
             await self.stream_app(scope, receive, send)
             return
 
-        headers = Headers(scope=scope)
         path = scope.get("path", "")
 
-        if path.startswith("/mcp") and _should_use_jsonrpc(scope, headers):
-            request = Request(scope, receive=receive)
-            response: Response = await _handle_jsonrpc(request)
-            await response(scope, receive, send)
+        if path.startswith("/mcp") and _should_use_jsonrpc(scope):
+            # The body is consumed here exactly once and never forwarded.
+            response = await _handle_jsonrpc(await _read_body(receive))
+            # The response is fully rendered, so send it without going through
+            # the generic Starlette response cycle.
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": response.status_code,
+                    "headers": response.raw_headers,
+                }
+            )
+            await send({"type": "http.response.body", "body": response.body})
             return
 
         await self.stream_app(scope, receive, send)
@@ -144,8 +281,19 @@ def create_app() -> Starlette:
         stateless_http=True,
     )
 
-    async def health(_: Request) -> JSONResponse:
-        return JSONResponse({"status": "ok", "server": mcp.name})
+    async def health(_: Request) -> ORJSONResponse:
+        return ORJSONResponse({"status": "ok", "server": mcp.name})
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        try:
+            async with stream_app.router.lifespan_context(app):
+                yield
+        finally:
+            # The provider is shared with the rest of the process; closing it only
+            # releases its connections, it reconnects if used again.
+            assert mcp.embedding_provider is not None
+            await mcp.embedding_provider.close()
 
     hybrid = HybridMCPApp(stream_app)
 
@@ -155,7 +303,7 @@ def create_app() -> Starlette:
             Route("/", health, methods=["GET"]),
             Mount("/", hybrid),
         ],
-        lifespan=stream_app.router.lifespan_context,
+        lifespan=lifespan,
     )
 
 
@@ -163,49 +311,90 @@ def create_app() -> Starlette:
 app = create_app()
 
 
+def _collection_from(arguments: Dict[str, Any]) -> str:
+    collection = arguments.get("collection_name") or mcp.qdrant_settings.collection_name
+    if not collection:
+        raise ValueError("collection_name is required when no default is set")
+    return collection
+
+
+@functools.lru_cache(maxsize=128)
+def _build_filter(filter_key: bytes) -> models.Filter:
+    # Keyed on the canonical JSON encoding, so nested (unhashable) filters can be
+    # cached too. The cached Filter instances are shared and must not be mutated.
+    return models.Filter(**orjson.loads(filter_key))
+
+
+async def _handle_store(arguments: Dict[str, Any]) -> List[str]:
+    information = arguments.get("information")
+    if not information:
+        raise ValueError("information is required")
+    metadata = arguments.get("metadata")
+    collection = _collection_from(arguments)
+    entry = Entry(content=information, metadata=metadata)
+    await mcp.qdrant_connector.store(entry, collection_name=collection)
+    return [f"Remembered: {information} in collection {collection}"]
+
+
+async def _handle_find(arguments: Dict[str, Any]) -> List[str]:
+    query = arguments.get("query")
+    if not query:
+        raise ValueError("query is required")
+    collection = _collection_from(arguments)
+    query_filter = arguments.get("query_filter")
+    filter_key = (
+        orjson.dumps(query_filter, option=orjson.OPT_SORT_KEYS)
+        if query_filter
+        else None
+    )
+    limit = mcp.qdrant_settings.search_limit
+    # Cached results are only valid for the same collection, filter and limit, and
+    # until the connector writes anything new.
+    generation = mcp.qdrant_connector.write_generation
+    cache_tag = (collection, filter_key, limit, generation)
+    # The filter is built first, so an invalid one does not cost an embedding request;
+    # building it is cheap since it is cached by its serialized form.
+    filter_obj = _build_filter(filter_key) if filter_key else None
+    assert mcp.embedding_provider is not None
+    query_vector = await mcp.embedding_provider.embed_query(query)
+    entries = _find_cache.get(query_vector, cache_tag)
+    if entries is None:
+        entries = await mcp.qdrant_connector.search_by_vector(
+            query_vector,
+            collection_name=collection,
+            limit=limit,
+            query_filter=filter_obj,
+        )
+        # Results of a search that overlapped a write might miss the new entry, and
+        # empty ones are not worth keeping, e.g. for a collection not created yet.
+        if entries and mcp.qdrant_connector.write_generation == generation:
+            _find_cache.put(query_vector, entries, cache_tag)
+    if not entries:
+        return ["No matching entries."]
+    # Each entry is returned as a JSON document, so clients can parse it directly.
+    # The FastMCP qdrant-find tool still formats entries with `format_entry`, as
+    # <entry> XML, so the two transports return different text for the same entry.
+    return [f"Results for the query '{query}'"] + [
+        orjson.dumps(
+            {"content": entry.content, "metadata": entry.metadata or {}}
+        ).decode()
+        for entry in entries
+    ]
+
+
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[List[str]]]] = {
+    "qdrant-store": _handle_store,
+    "qdrant-find": _handle_find,
+}
+
+
 async def _call_tool_direct(name: str, arguments: Dict[str, Any]) -> List[str]:
     """
     Minimal JSON-RPC handlers for qdrant-store and qdrant-find.
     Streamable HTTP requests still flow through FastMCP, so we only need to cover
     the simple JSON bridge used by Codex automation.
     """
-    if name == "qdrant-store":
-        information = arguments.get("information")
-        if not information:
-            raise ValueError("information is required")
-        metadata = arguments.get("metadata")
-        collection_name = arguments.get("collection_name")
-        collection = collection_name or mcp.qdrant_settings.collection_name
-        if not collection:
-            raise ValueError("collection_name is required when no default is set")
-        entry = Entry(content=information, metadata=metadata)
-        await mcp.qdrant_connector.store(entry, collection_name=collection)
-        return [f"Remembered: {information} in collection {collection}"]
-
-    if name == "qdrant-find":
-        query = arguments.get("query")
-        if not query:
-            raise ValueError("query is required")
-        collection_name = arguments.get("collection_name")
-        collection = collection_name or mcp.qdrant_settings.collection_name
-        if not collection:
-            raise ValueError("collection_name is required when no default is set")
-        query_filter = arguments.get("query_filter")
-        filter_obj = models.Filter(**query_filter) if query_filter else None
-        entries = await mcp.qdrant_connector.search(
-            query,
-            collection_name=collection,
-            limit=mcp.qdrant_settings.search_limit,
-            query_filter=filter_obj,
-        )
-        if not entries:
-            return ["No matching entries."]
-        content = [f"Results for the query '{query}'"]
-        for entry in entries:
-            entry_meta = entry.metadata or {}
-            content.append(
-                f"<entry><content>{entry.content}</content><metadata>{entry_meta}</metadata></entry>"
-            )
-        return content
-
-    raise ValueError(f"Unknown tool: {name}")
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return await handler(arguments)
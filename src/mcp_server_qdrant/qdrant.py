@@ -51,6 +51,15 @@ class QdrantConnector:
             location=qdrant_url, api_key=qdrant_api_key, path=qdrant_local_path
         )
         self._field_indexes = field_indexes
+        self._write_generation = 0
+
+    @property
+    def write_generation(self) -> int:
+        """
+        Counter bumped after every write done through this connector. Results cached by the callers are only
+        valid as long as the generation they were computed at is still the current one.
+        """
+        return self._write_generation
 
     async def get_collection_names(self) -> list[str]:
         """
@@ -69,26 +78,32 @@ class QdrantConnector:
         """
         collection_name = collection_name or self._default_collection_name
         assert collection_name is not None
-        await self._ensure_collection_exists(collection_name)
 
-        # Embed the document
+        # Embed the document before ensuring the collection exists, as some
+        # providers only learn their vector size from the first response.
         # ToDo: instead of embedding text explicitly, use `models.Document`,
         # it should unlock usage of server-side inference.
         embeddings = await self._embedding_provider.embed_documents([entry.content])
+        await self._ensure_collection_exists(collection_name)
 
         # Add to Qdrant
         vector_name = self._embedding_provider.get_vector_name()
         payload = {"document": entry.content, METADATA_PATH: entry.metadata}
-        await self._client.upsert(
-            collection_name=collection_name,
-            points=[
-                models.PointStruct(
-                    id=uuid.uuid4().hex,
-                    vector={vector_name: embeddings[0]},
-                    payload=payload,
-                )
-            ],
-        )
+        try:
+            await self._client.upsert(
+                collection_name=collection_name,
+                points=[
+                    models.PointStruct(
+                        id=uuid.uuid4().hex,
+                        vector={vector_name: embeddings[0]},
+                        payload=payload,
+                    )
+                ],
+            )
+        finally:
+            # Bumped only once the point is written, so a search running concurrently
+            # with the upsert is always computed at the previous generation.
+            self._write_generation += 1
 
     async def search(
         self,
@@ -109,6 +124,7 @@ class QdrantConnector:
         :return: A list of entries found.
         """
         collection_name = collection_name or self._default_collection_name
+        assert collection_name is not None
         collection_exists = await self._client.collection_exists(collection_name)
         if not collection_exists:
             return []
@@ -118,6 +134,56 @@ class QdrantConnector:
         # it should unlock usage of server-side inference.
 
         query_vector = await self._embedding_provider.embed_query(query)
+        return await self._query_points(
+            query_vector,
+            collection_name=collection_name,
+            limit=limit,
+            query_filter=query_filter,
+        )
+
+    async def search_by_vector(
+        self,
+        query_vector: list[float],
+        *,
+        collection_name: str | None = None,
+        limit: int = 10,
+        query_filter: models.Filter | None = None,
+    ) -> list[Entry]:
+        """
+        Find points in the Qdrant collection using an already embedded query. If there are no entries found,
+        an empty list is returned.
+        :param query_vector: The embedding of the query, as returned by the embedding provider.
+        :param collection_name: The name of the collection to search in, optional. If not provided,
+                                the default collection is used.
+        :param limit: The maximum number of entries to return.
+        :param query_filter: The filter to apply to the query, if any.
+
+        :return: A list of entries found.
+        """
+        collection_name = collection_name or self._default_collection_name
+        assert collection_name is not None
+        collection_exists = await self._client.collection_exists(collection_name)
+        if not collection_exists:
+            return []
+
+        return await self._query_points(
+            query_vector,
+            collection_name=collection_name,
+            limit=limit,
+            query_filter=query_filter,
+        )
+
+    async def _query_points(
+        self,
+        query_vector: list[float],
+        *,
+        collection_name: str,
+        limit: int,
+        query_filter: models.Filter | None,
+    ) -> list[Entry]:
+        """
+        Run the vector search against an existing collection and convert the points to entries.
+        """
         vector_name = self._embedding_provider.get_vector_name()
 
         # Search in Qdrant
@@ -0,0 +1,438 @@
+import asyncio
+import os
+import uuid
+from typing import Any
+from unittest import mock
+
+import orjson
+import pytest
+
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+
+# The module level server in `mcp_server_qdrant.server` is built from the
+# environment on import, so make sure it does not need to download any model.
+with mock.patch.dict(
+    os.environ,
+    {
+        "EMBEDDING_PROVIDER": "openai",
+        "EMBEDDING_MODEL": "text-embedding-3-small",
+        "OPENAI_API_KEY": "dummy-key",
+        "QDRANT_URL": ":memory:",
+    },
+):
+    from mcp_server_qdrant import http_app
+
+
+class FakeEmbeddingProvider(EmbeddingProvider):
+    """Deterministic provider embedding texts by their letter frequencies."""
+
+    def _embed(self, text: str) -> list[float]:
+        vector = [0.0] * 26
+        for char in text.lower():
+            if "a" <= char <= "z":
+                vector[ord(char) - ord("a")] += 1.0
+        vector[0] += 0.01
+        return vector
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        return [self._embed(document) for document in documents]
+
+    async def embed_query(self, query: str) -> list[float]:
+        return self._embed(query)
+
+    def get_vector_name(self) -> str:
+        return "fake"
+
+    def get_vector_size(self) -> int:
+        return 26
+
+
+@pytest.fixture
+def connector(monkeypatch):
+    """Point the module level server at an in-memory Qdrant and a fake provider."""
+    provider = FakeEmbeddingProvider()
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name=f"test_collection_{uuid.uuid4().hex}",
+        embedding_provider=provider,
+    )
+    monkeypatch.setattr(http_app.mcp, "embedding_provider", provider)
+    monkeypatch.setattr(http_app.mcp, "qdrant_connector", connector)
+    monkeypatch.setattr(
+        http_app.mcp.qdrant_settings,
+        "collection_name",
+        connector._default_collection_name,
+    )
+    monkeypatch.setattr(http_app, "_find_cache", http_app.SemanticCache())
+    return connector
+
+
+async def call_jsonrpc(payload) -> tuple[int, Any]:
+    """Send a JSON-RPC payload through HybridMCPApp and return the status and body."""
+    return await call_jsonrpc_raw(orjson.dumps(payload))
+
+
+async def call_jsonrpc_raw(body: bytes) -> tuple[int, Any]:
+    """Send a raw request body through HybridMCPApp and return the status and body."""
+
+    async def stream_app(scope, receive, send):
+        raise AssertionError("JSON-RPC requests must not reach the stream app")
+
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent: list[dict] = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/mcp",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"accept", b"application/json"),
+        ],
+    }
+    await http_app.HybridMCPApp(stream_app)(scope, receive, send)
+    status = sent[0]["status"]
+    reply = sent[1]["body"]
+    return status, orjson.loads(reply) if reply else None
+
+
+def find_call(id_value, query: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": id_value,
+        "method": "tools/call",
+        "params": {"name": "qdrant-find", "arguments": {"query": query}},
+    }
+
+
+def store_call(id_value, information: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": id_value,
+        "method": "tools/call",
+        "params": {"name": "qdrant-store", "arguments": {"information": information}},
+    }
+
+
+@pytest.mark.asyncio
+class TestFindCache:
+    """Tests for the semantic cache in front of the direct qdrant-find calls."""
+
+    async def test_store_through_connector_invalidates(self, connector):
+        """Test that writes not going through the JSON-RPC bridge are visible."""
+        await call_jsonrpc(store_call(1, "fox jumps"))
+        _, first = await call_jsonrpc(find_call(2, "fox jumps"))
+        assert len(first["result"]["content"]) == 2
+
+        await connector.store(Entry(content="fox jumps high"))
+        _, second = await call_jsonrpc(find_call(3, "fox jumps"))
+
+        assert len(second["result"]["content"]) == 3
+
+    async def test_repeated_find_is_cached(self, connector, monkeypatch):
+        """Test that a repeated query does not search Qdrant again."""
+        await call_jsonrpc(store_call(1, "fox jumps"))
+        _, first = await call_jsonrpc(find_call(2, "fox jumps"))
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("The cached result should have been used")
+
+        monkeypatch.setattr(connector, "search_by_vector", fail)
+        _, second = await call_jsonrpc(find_call(3, "fox jumps"))
+
+        assert second["result"] == first["result"]
+
+    async def test_empty_results_are_not_cached(self, connector):
+        """Test that a find before the collection exists does not hide new entries."""
+        _, first = await call_jsonrpc(find_call(1, "fox jumps"))
+        assert first["result"]["content"][0]["text"] == "No matching entries."
+
+        await connector.store(Entry(content="fox jumps"))
+        _, second = await call_jsonrpc(find_call(2, "fox jumps"))
+
+        assert len(second["result"]["content"]) == 2
+
+    async def test_search_overlapping_a_write_is_not_cached(
+        self, connector, monkeypatch
+    ):
+        """Test that results computed before a concurrent write are not cached."""
+        await call_jsonrpc(store_call(1, "fox jumps"))
+        search_by_vector = connector.search_by_vector
+
+        async def search_then_write(*args, **kwargs):
+            entries = await search_by_vector(*args, **kwargs)
+            await connector.store(Entry(content="fox jumps high"))
+            return entries
+
+        monkeypatch.setattr(connector, "search_by_vector", search_then_write)
+        await call_jsonrpc(find_call(2, "fox jumps"))
+        monkeypatch.setattr(connector, "search_by_vector", search_by_vector)
+        _, result = await call_jsonrpc(find_call(3, "fox jumps"))
+
+        assert len(result["result"]["content"]) == 3
+
+
+@pytest.mark.asyncio
+class TestFind:
+    """Tests for the direct qdrant-find handler."""
+
+    async def test_results_are_json_documents(self, connector):
+        """Test that each found entry is returned as a content and metadata document."""
+        await connector.store(Entry(content="fox jumps", metadata={"animal": "fox"}))
+        await connector.store(Entry(content="fox jumps high"))
+        _, reply = await call_jsonrpc(find_call(1, "fox jumps"))
+
+        texts = [block["text"] for block in reply["result"]["content"]]
+        assert texts[0] == "Results for the query 'fox jumps'"
+        documents = sorted(
+            (orjson.loads(text) for text in texts[1:]), key=lambda d: d["content"]
+        )
+        assert documents == [
+            {"content": "fox jumps", "metadata": {"animal": "fox"}},
+            {"content": "fox jumps high", "metadata": {}},
+        ]
+
+    async def test_equal_filters_share_a_cache_entry(self, connector, monkeypatch):
+        """Test that equal filters with differently ordered keys are built once."""
+        http_app._build_filter.cache_clear()
+        condition = {"key": "metadata.animal", "match": {"value": "fox"}}
+        for query_filter in (
+            {"must": [condition], "must_not": []},
+            {"must_not": [], "must": [dict(reversed(condition.items()))]},
+        ):
+            payload = find_call(1, "fox jumps")
+            payload["params"]["arguments"]["query_filter"] = query_filter
+            await call_jsonrpc(payload)
+
+        info = http_app._build_filter.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    async def test_nested_filter_is_applied(self, connector):
+        """Test that a nested must filter restricts a JSON-RPC find."""
+        await connector.store(Entry(content="fox jumps", metadata={"animal": "fox"}))
+        await connector.store(Entry(content="dog jumps", metadata={"animal": "dog"}))
+        payload = find_call(1, "jumps")
+        payload["params"]["arguments"]["query_filter"] = {
+            "must": [{"key": "metadata.animal", "match": {"value": "fox"}}]
+        }
+        _, reply = await call_jsonrpc(payload)
+
+        documents = [
+            orjson.loads(block["text"]) for block in reply["result"]["content"][1:]
+        ]
+        assert [document["content"] for document in documents] == ["fox jumps"]
+
+    async def test_invalid_filter_is_not_cached(self, connector):
+        """Test that a filter failing validation is reported and not cached."""
+        http_app._build_filter.cache_clear()
+        payload = find_call(1, "fox jumps")
+        payload["params"]["arguments"]["query_filter"] = {"must": "not a condition"}
+        _, reply = await call_jsonrpc(payload)
+
+        assert reply["error"]["code"] == -32000
+        assert http_app._build_filter.cache_info().currsize == 0
+
+    async def test_invalid_filter_skips_embedding(self, connector, monkeypatch):
+        """Test that an invalid filter fails the call before embedding the query."""
+
+        embedded: list[str] = []
+
+        async def embed_query(query):
+            embedded.append(query)
+            return [1.0] * 26
+
+        monkeypatch.setattr(connector._embedding_provider, "embed_query", embed_query)
+        payload = find_call(1, "fox jumps")
+        payload["params"]["arguments"]["query_filter"] = {"must": "not a condition"}
+        _, reply = await call_jsonrpc(payload)
+
+        assert reply["error"]["code"] == -32000
+        assert embedded == []
+
+    async def test_cancelled_find_leaves_no_task(self, connector, monkeypatch):
+        """Test that cancelling a find during the embedding does not leak a task."""
+        started = asyncio.Event()
+
+        async def slow_embed_query(query):
+            started.set()
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(
+            connector._embedding_provider, "embed_query", slow_embed_query
+        )
+        tasks_before = asyncio.all_tasks()
+        find = asyncio.create_task(http_app._handle_find({"query": "fox jumps"}))
+        await started.wait()
+        find.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await find
+
+        assert asyncio.all_tasks() - tasks_before == set()
+
+
+@pytest.mark.parametrize(
+    "raw_name, expected",
+    [
+        ("qdrant-find", "qdrant-find"),
+        ("qdrant.qdrant-find", "qdrant-find"),
+        ("qdrant-rag.qdrant-store", "qdrant-store"),
+        ("qdrant-rag-mcp.x", "x"),
+        ("qdrant_qdrant-find", "qdrant-find"),
+        ("qdrant_a.b", "qdrant_a.b"),
+        ("qdrant-rag.a.b", "a.b"),
+        ("qdrant.", ""),
+        ("qdrant_", ""),
+        (".x", ".x"),
+        ("a.b.c", "a.b.c"),
+        ("other.qdrant-find", "other.qdrant-find"),
+    ],
+)
+def test_resolve_tool_name(raw_name, expected):
+    """Test that only the known namespaces and the qdrant_ prefix are stripped."""
+    assert http_app._resolve_tool_name(raw_name) == expected
+
+
+@pytest.mark.parametrize("raw_name", [None, ""])
+def test_resolve_missing_tool_name(raw_name):
+    """Test that a missing tool name is rejected."""
+    with pytest.raises(ValueError):
+        http_app._resolve_tool_name(raw_name)
+
+
+def ping(id_value=None) -> dict:
+    if id_value is None:
+        return {"jsonrpc": "2.0", "method": "ping"}
+    return {"jsonrpc": "2.0", "id": id_value, "method": "ping"}
+
+
+@pytest.mark.asyncio
+class TestJsonRpc:
+    """Tests for the JSON-RPC shim served by HybridMCPApp."""
+
+    async def test_single_request(self, connector):
+        """Test that a single object gets a single reply."""
+        status, reply = await call_jsonrpc(ping(1))
+
+        assert status == 200
+        assert reply == {"jsonrpc": "2.0", "id": 1, "result": {"status": "ok"}}
+
+    async def test_invalid_json(self, connector):
+        """Test that an undecodable body is rejected with a 400."""
+        status, reply = await call_jsonrpc_raw(b"{not json")
+
+        assert status == 400
+        assert reply == {"error": "Invalid JSON-RPC payload"}
+
+    async def test_batch(self, connector):
+        """Test that a batch gets one reply per request, in order."""
+        status, reply = await call_jsonrpc(
+            [ping(1), store_call(2, "fox jumps"), find_call(3, "fox jumps")]
+        )
+
+        assert status == 200
+        assert [item["id"] for item in reply] == [1, 2, 3]
+        assert all("result" in item for item in reply)
+
+    async def test_batch_skips_notifications(self, connector):
+        """Test that notifications in a batch get no reply."""
+        status, reply = await call_jsonrpc([ping(), ping(1), ping()])
+
+        assert status == 200
+        assert [item["id"] for item in reply] == [1]
+
+    async def test_batch_of_notifications_only(self, connector):
+        """Test that a batch made only of notifications gets an empty 204."""
+        status, reply = await call_jsonrpc([ping(), ping()])
+
+        assert status == 204
+        assert reply is None
+
+    async def test_empty_batch(self, connector):
+        """Test that an empty batch is an invalid request."""
+        status, reply = await call_jsonrpc([])
+
+        assert status == 200
+        assert reply["error"]["code"] == -32600
+
+    async def test_batch_too_large(self, connector, monkeypatch):
+        """Test that batches above the limit are rejected as a whole."""
+        monkeypatch.setattr(http_app, "_MAX_BATCH_SIZE", 2)
+        status, reply = await call_jsonrpc([ping(1), ping(2), ping(3)])
+
+        assert status == 200
+        assert reply["error"]["code"] == -32600
+
+    async def test_batch_with_invalid_items(self, connector, monkeypatch):
+        """Test that malformed items only fail their own reply."""
+
+        async def broken_tool_payload():
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(http_app, "_tool_payload", broken_tool_payload)
+        status, reply = await call_jsonrpc(
+            [
+                ping(1),
+                5,
+                {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": [1, 2]},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 3,
+                    "method": "tools/call",
+                    "params": {"name": "qdrant-find", "arguments": "fox"},
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 4,
+                    "method": "tools/call",
+                    "params": {"name": 7},
+                },
+                {"jsonrpc": "2.0", "id": 5, "method": "tools/list"},
+                {"jsonrpc": "2.0", "id": 6, "method": "unknown"},
+            ]
+        )
+
+        assert status == 200
+        assert reply[0]["result"] == {"status": "ok"}
+        assert [item.get("error", {}).get("code") for item in reply[1:]] == [
+            -32600,
+            -32602,
+            -32602,
+            -32602,
+            -32603,
+            -32601,
+        ]
+        assert [item["id"] for item in reply] == [1, None, 2, 3, 4, 5, 6]
+
+    async def test_tools_list_is_memoized(self, connector, monkeypatch):
+        """Test that tools/list is built once, until tools/list_changed is received."""
+        monkeypatch.setattr(http_app, "_tool_payload_cache", None)
+        get_tools = http_app.mcp._tool_manager.get_tools
+        calls = []
+
+        async def counting_get_tools():
+            calls.append(1)
+            return await get_tools()
+
+        monkeypatch.setattr(http_app.mcp._tool_manager, "get_tools", counting_get_tools)
+        tools_list = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+
+        _, first = await call_jsonrpc(tools_list)
+        _, second = await call_jsonrpc(tools_list)
+        assert len(calls) == 1
+        assert second == first
+        assert {"qdrant-find", "qdrant-store"} <= {
+            tool["name"] for tool in first["result"]["tools"]
+        }
+
+        await call_jsonrpc({"jsonrpc": "2.0", "id": 2, "method": "tools/list_changed"})
+        _, third = await call_jsonrpc(tools_list)
+        assert len(calls) == 2
+        assert third == first
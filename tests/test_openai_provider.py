@@ -0,0 +1,167 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from mcp_server_qdrant.embeddings import openai_provider
+from mcp_server_qdrant.embeddings.openai_provider import OpenAIEmbeddingProvider
+
+
+class FakeAsyncEmbeddings:
+    """Stand-in for the `embeddings` resource of the AsyncOpenAI client."""
+
+    def __init__(self, dim: int = 4):
+        self.dim = dim
+        self.calls: list = []
+
+    def _vector(self, text: str) -> list[float]:
+        return [float(len(text))] + [0.0] * (self.dim - 1)
+
+    async def create(self, model, input):
+        self.calls.append(input)
+        inputs = [input] if isinstance(input, str) else list(input)
+        data = [
+            SimpleNamespace(index=i, embedding=self._vector(text))
+            for i, text in enumerate(inputs)
+        ]
+        # Return the items out of order to make sure the provider restores it.
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+@pytest.fixture
+def fake_embeddings(monkeypatch):
+    """Patch the OpenAI client used by the provider with an in-memory fake."""
+    embeddings = FakeAsyncEmbeddings()
+    monkeypatch.setattr(
+        openai_provider,
+        "AsyncOpenAI",
+        lambda **kwargs: SimpleNamespace(
+            embeddings=embeddings, is_closed=lambda: False
+        ),
+    )
+    return embeddings
+
+
+@pytest.mark.asyncio
+class TestOpenAIEmbeddingProvider:
+    """Tests for OpenAIEmbeddingProvider using a fake OpenAI client."""
+
+    async def test_embed_documents_batches_preserve_order(
+        self, fake_embeddings, monkeypatch
+    ):
+        """Test that documents split across batches come back in input order."""
+        monkeypatch.setattr(openai_provider, "_BATCH_SIZE", 3)
+        provider = OpenAIEmbeddingProvider("custom-model")
+        documents = ["a" * n for n in range(1, 9)]
+
+        embeddings = await provider.embed_documents(documents)
+
+        assert len(fake_embeddings.calls) == 3
+        assert [embedding[0] for embedding in embeddings] == [
+            float(n) for n in range(1, 9)
+        ]
+
+    async def test_embed_documents_empty(self, fake_embeddings):
+        """Test that an empty input does not hit the API."""
+        provider = OpenAIEmbeddingProvider("custom-model")
+
+        assert await provider.embed_documents([]) == []
+        assert fake_embeddings.calls == []
+
+    async def test_known_model_vector_size(self, fake_embeddings):
+        """Test that well-known models do not need any request to get the size."""
+        provider = OpenAIEmbeddingProvider("text-embedding-3-large")
+
+        assert provider.get_vector_size() == 3072
+        assert fake_embeddings.calls == []
+
+    async def test_unknown_model_vector_size(self, fake_embeddings):
+        """Test that the size of other models is learned from the first response."""
+        provider = OpenAIEmbeddingProvider("custom-model")
+        with pytest.raises(RuntimeError):
+            provider.get_vector_size()
+
+        await provider.embed_query("hello")
+
+        assert provider.get_vector_size() == fake_embeddings.dim
+
+    async def test_embed_query_cache(self, fake_embeddings):
+        """Test that repeated queries are served from the cache."""
+        provider = OpenAIEmbeddingProvider("custom-model")
+
+        first = await provider.embed_query("Hello ")
+        second = await provider.embed_query("hello")
+
+        assert first == second
+        assert fake_embeddings.calls == ["Hello "]
+
+    async def test_embed_query_cache_eviction(self, fake_embeddings):
+        """Test that the least recently used query is evicted first."""
+        provider = OpenAIEmbeddingProvider("custom-model")
+        provider._query_cache_max = 2
+
+        await provider.embed_query("a")
+        await provider.embed_query("b")
+        await provider.embed_query("a")
+        await provider.embed_query("c")
+        await provider.embed_query("b")
+
+        assert fake_embeddings.calls == ["a", "b", "c", "b"]
+
+    async def test_embed_documents_missing_items(self, fake_embeddings, monkeypatch):
+        """Test that a response with fewer embeddings than inputs is rejected."""
+        original_create = fake_embeddings.create
+
+        async def truncated_create(model, input):
+            response = await original_create(model, input)
+            response.data = response.data[:-1]
+            return response
+
+        monkeypatch.setattr(fake_embeddings, "create", truncated_create)
+        provider = OpenAIEmbeddingProvider("custom-model")
+
+        with pytest.raises(RuntimeError):
+            await provider.embed_documents(["a", "b", "c"])
+
+
+async def test_real_client_uses_http2_pool(monkeypatch):
+    """Test that the provider builds the real OpenAI client on a pooled HTTP/2 client."""
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy-key")
+    provider = OpenAIEmbeddingProvider("text-embedding-3-small")
+    try:
+        http_client = provider._async_client._client
+        assert isinstance(http_client, httpx.AsyncClient)
+        transport = http_client._transport
+        assert isinstance(transport, httpx.AsyncHTTPTransport)
+        assert transport._pool._http2
+        assert transport._pool._max_connections == 64
+    finally:
+        await provider.close()
+
+
+async def test_real_client_honours_proxy_env(monkeypatch):
+    """Test that proxies from the environment are still used by the real client."""
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy-key")
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    provider = OpenAIEmbeddingProvider("text-embedding-3-small")
+    try:
+        http_client = provider._async_client._client
+        assert http_client._mounts
+        assert http_client.follow_redirects
+    finally:
+        await provider.close()
+
+
+async def test_closed_client_is_reopened(monkeypatch):
+    """Test that a provider keeps working after being closed, e.g. on app shutdown."""
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy-key")
+    provider = OpenAIEmbeddingProvider("text-embedding-3-small")
+    first_client = provider._async_client
+    await provider.close()
+
+    client = provider._client()
+    try:
+        assert client is not first_client
+        assert not client.is_closed()
+    finally:
+        await provider.close()
@@ -0,0 +1,72 @@
+from mcp_server_qdrant.embeddings.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Tests for the embedding-keyed SemanticCache."""
+
+    def test_similar_embedding_hits(self):
+        """Test that a close enough embedding returns the stored value."""
+        cache: SemanticCache[str] = SemanticCache(threshold=0.97)
+        cache.put([1.0, 0.0, 0.0], "value")
+
+        assert cache.get([2.0, 0.1, 0.0]) == "value"
+        assert cache.get([0.0, 1.0, 0.0]) is None
+
+    def test_tags_are_isolated(self):
+        """Test that entries are only returned for the tag they were stored with."""
+        cache: SemanticCache[str] = SemanticCache()
+        cache.put([1.0, 0.0], "first", tag="collection-a")
+        cache.put([1.0, 0.0], "second", tag="collection-b")
+
+        assert cache.get([1.0, 0.0], tag="collection-a") == "first"
+        assert cache.get([1.0, 0.0], tag="collection-b") == "second"
+        assert cache.get([1.0, 0.0], tag="collection-c") is None
+
+    def test_ring_buffer_overwrites_oldest(self):
+        """Test that the oldest entry is overwritten once the capacity is reached."""
+        cache: SemanticCache[int] = SemanticCache(capacity=2)
+        cache.put([1.0, 0.0, 0.0], 1)
+        cache.put([0.0, 1.0, 0.0], 2)
+        cache.put([0.0, 0.0, 1.0], 3)
+
+        assert len(cache) == 2
+        assert cache.get([1.0, 0.0, 0.0]) is None
+        assert cache.get([0.0, 1.0, 0.0]) == 2
+        assert cache.get([0.0, 0.0, 1.0]) == 3
+
+    def test_grows_past_initial_allocation(self):
+        """Test that the cache keeps all the entries while growing its storage."""
+        cache: SemanticCache[int] = SemanticCache(capacity=200)
+        for i in range(150):
+            embedding = [0.0] * 150
+            embedding[i] = 1.0
+            cache.put(embedding, i)
+
+        assert len(cache) == 150
+        probe = [0.0] * 150
+        probe[149] = 1.0
+        assert cache.get(probe) == 149
+
+    def test_clear(self):
+        """Test that clearing the cache removes all the entries."""
+        cache: SemanticCache[str] = SemanticCache()
+        cache.put([1.0, 0.0], "value")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get([1.0, 0.0]) is None
+
+    def test_expired_entries_are_not_returned(self, monkeypatch):
+        """Test that entries older than the TTL are ignored."""
+        now = [1000.0]
+        monkeypatch.setattr(
+            "mcp_server_qdrant.embeddings.semantic_cache.time.monotonic",
+            lambda: now[0],
+        )
+        cache: SemanticCache[str] = SemanticCache(ttl=10.0)
+        cache.put([1.0, 0.0], "value")
+
+        now[0] += 5.0
+        assert cache.get([1.0, 0.0]) == "value"
+        now[0] += 6.0
+        assert cache.get([1.0, 0.0]) is None